@@ -14,7 +14,7 @@ def handle_step(model_id: int) -> dict:
     """
     Steps through the model once.
     """
-    logger.info(f"Stepping through model {model_id}.")
+    logger.info("Stepping through model %s.", model_id)
     controller.step_model(model_id)
     return {"status": "success", "action": "step"}
 
@@ -23,7 +23,7 @@ def handle_reverse_step(model_id: int) -> dict:
     """
     Reverse steps through the model once.
     """
-    logger.info(f"Reverse stepping through model {model_id}.")
+    logger.info("Reverse stepping through model %s.", model_id)
     controller.step_model(model_id, time=-1)
     return {"status": "success", "action": "reverse_step"}
 
@@ -33,7 +33,9 @@ def handle_get_current_week(model_id: int) -> dict:
     Returns the current week.
     """
     current_week = controller.get_current_week(model_id)
-    logger.info(f"Retrieving current week({current_week}) for model {model_id}.")
+    logger.info(
+        "Retrieving current week(%s) for model %s.", current_week, model_id
+    )
     return {
         "status": "success",
         "action": "get_current_week",
@@ -45,9 +47,9 @@ def handle_get_industry_data(model_id: int) -> dict:
     """
     Creates a dictionary of each industry variable across the whole simulation to be able to plot easily.
     """
-    logger.info(f"Retrieving industry data for model {model_id}.")
-    industries_df = controller.get_industry_data(model_id)
-    industries_df = industries_df[industries_df["week"] > 0]
+    logger.info("Retrieving industry data for model %s.", model_id)
+    # week 0 is the initial state, so only request data from the first step onwards
+    industries_df = controller.get_industry_data(model_id, start_time=1)
 
     industries_dict = {}
     # make each industries its own column, with the other stuff being the value as a dict.
@@ -66,7 +68,7 @@ def handle_get_current_industry_data(model_id: int) -> dict:
     """
     Creates a dictionary of the latest industry variables for each industry.
     """
-    logger.info(f"Retrieving current industry data for model {model_id}.")
+    logger.info("Retrieving current industry data for model %s.", model_id)
     current_week = controller.get_current_week(model_id)
     # Get data only for the current week
     industries_df = controller.get_industry_data(
@@ -98,9 +100,8 @@ def handle_get_demo_metrics(model_id: int) -> dict:
     """
     Creates a dictionary of each demographic metric across the whole simulation to be able to plot easily.
     """
-    logger.info(f"Retrieving demographic metrics for model {model_id}.")
-    metrics_df = controller.get_demo_metrics(model_id)
-    metrics_df = metrics_df[metrics_df["week"] > 0]
+    logger.info("Retrieving demographic metrics for model %s.", model_id)
+    metrics_df = controller.get_demo_metrics(model_id, start_time=1)
 
     metrics_dict = {}
     # make each demographics its own column, with the other stuff being the value as a dict.
@@ -119,7 +120,7 @@ def handle_get_current_demo_metrics(model_id: int) -> dict:
     """
     Creates a dictionary of the latest demographic metrics for each industry.
     """
-    logger.info(f"Retrieving current demographic metrics for model {model_id}.")
+    logger.info("Retrieving current demographic metrics for model %s.", model_id)
 
     current_week = controller.get_current_week(model_id)
     # Get data only for the current week
@@ -152,13 +153,17 @@ def handle_get_indicators(model_id: int) -> dict:
     """
     Creates a dictionary of each indicator across the whole simulation to be able to plot easily.
     """
-    logger.info(f"Retrieving indicators for model {model_id}.")
-    indicators_df = controller.get_indicators(model_id)
-    indicators_df = indicators_df[indicators_df["week"] > 0]
+    logger.info("Retrieving indicators for model %s.", model_id)
+    indicators_df = controller.get_indicators(model_id, start_time=1)
+    # build the column lists straight from the underlying arrays; faster than to_dict(orient="list")
+    indicators_dict = {
+        column: indicators_df[column].to_numpy().tolist()
+        for column in indicators_df.columns
+    }
     return {
         "status": "success",
         "action": "get_indicators",
-        "data": indicators_df.to_dict(orient="list"),
+        "data": indicators_dict,
     }
 
 
@@ -166,7 +171,7 @@ def handle_get_policies(model_id: int) -> dict:
     """
     Returns the policies associated with the model.
     """
-    logger.info(f"Retrieving policies for model {model_id}.")
+    logger.info("Retrieving policies for model %s.", model_id)
     policies = controller.get_policies(model_id)
     return {
         "status": "success",
@@ -181,7 +186,7 @@ def handle_set_policies(model_id: int, policies: dict) -> dict:
     """
     if policies == None:
         raise ValueError("Policies cannot be None.")
-    logger.info(f"Setting policies for model {model_id}.")
+    logger.info("Setting policies for model %s.", model_id)
     controller.set_policies(model_id, policies)
     return {
         "status": "success",
@@ -243,7 +248,7 @@ async def model_websocket(websocket: WebSocket, model_id: int):
                     else:
                         response = handler(model_id)
                 else:
-                    logger.error(f"Unknown action: {action} selected.")
+                    logger.error("Unknown action: %s selected.", action)
                     response = {
                         "status": "error",
                         "message": f"Unknown action: {action}",
@@ -256,10 +261,12 @@ async def model_websocket(websocket: WebSocket, model_id: int):
                 logger.error(str(e))
                 await websocket.send_json({"status": "error", "message": str(e)})
             except WebSocketDisconnect:
-                logger.info(f"Client for model {model_id} disconnected.")
+                logger.info("Client for model %s disconnected.", model_id)
                 break
 
     except ValueError:  # Catches if model_id is not found
-        logger.error(f"Model with id {model_id} not found. WebSocket will be closed...")
+        logger.error(
+            "Model with id %s not found. WebSocket will be closed...", model_id
+        )
         await websocket.send_json({"error": f"Model with id {model_id} not found."})
         await websocket.close()
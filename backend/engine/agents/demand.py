@@ -1,4 +1,6 @@
-import math
+from math import floor
+import numpy as np
+from typing import Iterable
 from ..types.industry_type import IndustryType
 
 
@@ -21,18 +23,22 @@ def demand_func(
 
     valid_goods = [name for name in prefs if name in prices]
 
-    denominator = sum(
-        (prefs[name] ** sigma) * (prices[name] ** (1 - sigma)) for name in valid_goods
-    )
+    # a^sigma * p^(1-sigma) is shared by the denominator and, divided by p, the numerator
+    # (a^sigma * p^-sigma), so each good only needs its powers computed once.
+    weighted = {
+        name: (prefs[name] ** sigma) * (prices[name] ** (1 - sigma))
+        for name in valid_goods
+    }
+    denominator = sum(weighted.values())
 
     if denominator == 0:
         return {name: 0 for name in valid_goods}
 
     demands = {}
     for name in valid_goods:
-        numerator = (prefs[name] ** sigma) * (prices[name] ** -sigma)
+        numerator = weighted[name] / prices[name]
         quantity_unrounded = (numerator / denominator) * budget #value is not rounded until purchase step.  This allows for savings accumulation.
-        demands[name] = quantity_unrounded  
+        demands[name] = quantity_unrounded
 
     return demands
 
@@ -42,7 +48,7 @@ def custom_round(x: float) -> int:
     Round up if x is within 1e-9 of the next whole number,
     otherwise round down.
     """
-    lower = math.floor(x)
+    lower = floor(x)
     upper = lower + 1
 
     # If x is within 1e-9 (tolerance for floating point errors) of the upper integer, round up
@@ -50,3 +56,90 @@ def custom_round(x: float) -> int:
         return upper
     else:
         return lower
+
+
+class PreferenceLayout:
+    """
+    The preferences of many consumers flattened into a CSR-style sparse layout,
+    so consumers with differing preference sets can be evaluated in a single batch.
+
+    Consumer i's goods and weights are `goods[indptr[i]:indptr[i + 1]]` and
+    `weights[indptr[i]:indptr[i + 1]]`, with goods given as indices into `industry_types`.
+
+    Attributes:
+        industry_types (list[IndustryType]): The industry types that goods indices refer to.
+        rows (dict[int, int]): Maps each consumer's unique_id to their row.
+        indptr (np.ndarray): The offsets of each consumer's row.
+        goods (np.ndarray): The flattened goods indices of every row.
+        weights (np.ndarray): The flattened preference weights of every row.
+    """
+
+    def __init__(self, consumers: Iterable):
+        """
+        Flattens the preferences of the consumers into the layout.
+
+        Args:
+            consumers (Iterable): Objects with a `unique_id` and a `preferences` dictionary,
+                e.g. PersonAgents. Preferences for unknown industries are ignored.
+        """
+        self.industry_types = list(IndustryType)
+        industry_index = {itype: i for i, itype in enumerate(self.industry_types)}
+
+        self.rows = {}
+        indptr = [0]
+        goods = []
+        weights = []
+        for row, consumer in enumerate(consumers):
+            self.rows[consumer.unique_id] = row
+            for name, weight in consumer.preferences.items():
+                index = industry_index.get(name)
+                if index is None:
+                    continue
+                goods.append(index)
+                weights.append(weight)
+            indptr.append(len(goods))
+
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.goods = np.array(goods, dtype=np.int64)
+        self.weights = np.array(weights, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+def batch_demand_func(
+    sigmas: np.ndarray,
+    budgets: np.ndarray,
+    layout: PreferenceLayout,
+    prices: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculates the CES demand of many consumers at once. Equivalent to calling `demand_func`
+    for each row of the layout.
+
+    Args:
+        sigmas: The elasticity of substitution of each consumer, in row order.
+        budgets: The total money available to each consumer, in row order.
+        layout: The consumers' preferences.
+        prices: The price of each industry type, indexed like `layout.industry_types`.
+            NaN marks goods that are not available, which are left out like in `demand_func`.
+    Returns:
+        The unrounded quantity demanded, aligned with `layout.goods`.
+    """
+    rows = np.repeat(np.arange(len(layout)), np.diff(layout.indptr))
+    sigma = sigmas[rows]
+    good_prices = prices[layout.goods]
+    available = ~np.isnan(good_prices)
+
+    # same shared a^sigma * p^(1-sigma) term as demand_func
+    weighted = np.where(
+        available, layout.weights**sigma * good_prices ** (1 - sigma), 0.0
+    )
+    denominators = np.bincount(rows, weights=weighted, minlength=len(layout))[rows]
+
+    demands = np.zeros_like(weighted)
+    valid = available & (denominators != 0)
+    demands[valid] = (
+        weighted[valid] / good_prices[valid] / denominators[valid] * budgets[rows][valid]
+    )
+    return demands
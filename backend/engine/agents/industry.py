@@ -4,7 +4,9 @@ from ..types.industry_type import IndustryType, INDUSTRY_PRICING
 from ..types.pricing_type import PricingType
 from .pricing import avg_cost, linear_profit_max, linear_price, quantity_from_price
 import logging
-import math
+from math import isfinite, inf
+
+logger = logging.getLogger(__name__)
 
 
 class IndustryAgent(Agent):
@@ -24,6 +26,8 @@ class IndustryAgent(Agent):
     """The type of industry this agent represents."""
     debt_allowed: bool
     """Whether this industry is allowed to go into debt."""
+    pricing_strategy: PricingType
+    """The pricing strategy used by this industry, determined by its industry type."""
 
     price: float
     """The price of goods/services in this industry."""
@@ -33,18 +37,12 @@ class IndustryAgent(Agent):
     """The inventory available for sale this time step."""
     balance: float
     """The total money held by this industry. Negative indicates debt."""
-    raw_mat_cost: float
-    """The cost of raw materials per unit produced."""
 
     # Employment Variables
     # TODO: Possible feature for employment logic: have each person agent have a custom wage, with minimum wage floor, meaning some workers are cheaper than others
-    offered_wage: float
-    """The weekly wage offered by this industry."""
     num_employees: int
     """The number of employees in this industry."""
     # TODO: Possible feature for employment logic: have each person agent have a custom efficiency, meaning some workers produce more goods than others
-    worker_efficiency: float
-    """The efficiency of workers in this industry (units produced per worker per hour)."""
     hours_worked: float
     """Number of hours worked by each employee this tick, used for updating employee pay"""
 
@@ -59,8 +57,6 @@ class IndustryAgent(Agent):
     property_value: float  # value of all property owned by industryAgent.  used with property tax to calculate cost per tick
     insurance: float  # insurance payments per tick
     equipment_cost: float  # cost of equipment/machines per tick
-    fixed_cost: float  # shorthand value used for testing. Will eventually be phased out in favor of calls to get_fixed_cost, which will work similarly to get_variable_cost
-    """The fixed cost incurred by this industry per time step."""
 
     # Used in profit calculation
     total_cost: float
@@ -73,7 +69,7 @@ class IndustryAgent(Agent):
         self,
         model: Model,
         industry_type: IndustryType,
-        starting_price: float = 0.0,  # This should only be passed in when testing.  Determine_price & determine_price_production_cap will entirely handle updates to this value
+        starting_price: float = 0.0,  # This should only be passed in when testing.  determine_price will entirely handle updates to this value
         starting_inventory: int = 200,
         starting_balance: float = 5000.00,
         starting_offered_wage: float = 15.00,
@@ -95,17 +91,27 @@ class IndustryAgent(Agent):
         """
         super().__init__(model)
         self.industry_type = industry_type
-        self.price = starting_price
+        self.pricing_strategy = INDUSTRY_PRICING[industry_type]
+        self.price = float(starting_price)
         self.inventory = starting_inventory
         self.balance = starting_balance
-        self.offered_wage = starting_offered_wage
+        self._fixed_cost_naive = 0.0  # calculated by get_fixed_cost_naive
         self.fixed_cost = starting_fixed_cost
+        # validated here, then kept valid by their setters
+        self._offered_wage = self.validate_cost_input(
+            "offered_wage", starting_offered_wage
+        )
+        self._worker_efficiency = self.validate_cost_input(
+            "worker_efficiency", starting_worker_efficiency
+        )
+        self.update_labor_cost()
         self.raw_mat_cost = starting_raw_mat_cost
+        self._raw_mat_cost_modifier = 0.0  # calculated by get_raw_mat_cost_modifier
+        self._raw_mat_cost_modifier_step = -1
+        self._variable_cost = 0.0  # calculated by get_variable_cost
         self.num_employees = starting_number_of_employees
-        self.worker_efficiency = starting_worker_efficiency
         self.debt_allowed = starting_debt_allowed
-        self.demand_intercept = starting_demand_intercept
-        self.demand_slope = starting_demand_slope
+        self.set_demand_graph_params(starting_demand_intercept, starting_demand_slope)
         self.inventory_available_this_step = 0  # calculated by determine_price
         self.hours_worked = 0  # calculated by produce_goods
         self.total_cost = 0.0
@@ -116,12 +122,107 @@ class IndustryAgent(Agent):
         self.insurance = insurance
         self.goods_produced: int = 0  # Tracker for GDP indicator
 
+    @staticmethod
+    def validate_cost_input(name: str, value: float) -> float:
+        """
+        Checks that a cost input is a finite number.
+
+        Args:
+            name (str): The name of the input, for the error message.
+            value (float): The value to check.
+        Returns:
+            value (float): The value as a float.
+        Raises:
+            ValueError: If the value is not numeric, or is NaN/infinite.
+        """
+        try:
+            value = float(value)
+        except Exception as exc:
+            raise ValueError(f"{name} must be numeric") from exc
+        # catches both NaN and infinite values in one check
+        if not isfinite(value):
+            raise ValueError(f"Non-finite cost input encountered in {name}: {value}")
+        return value
+
+    def update_labor_cost(self) -> None:
+        """
+        Updates the labor cost per unit (wage / efficiency) after either changes.
+        If efficiency <= 0, production is impossible and the labor cost per unit is infinite.
+        """
+        if self._worker_efficiency <= 0.0:
+            self._labor_cost = inf
+        else:
+            self._labor_cost = self._offered_wage / self._worker_efficiency
+        self._variable_cost_step = -1  # variable cost needs to be recalculated
+
+    @property
+    def offered_wage(self) -> float:
+        """The weekly wage offered by this industry."""
+        return self._offered_wage
+
+    @offered_wage.setter
+    def offered_wage(self, value: float):
+        self._offered_wage = self.validate_cost_input("offered_wage", value)
+        self.update_labor_cost()
+
+    @property
+    def worker_efficiency(self) -> float:
+        """The efficiency of workers in this industry (units produced per worker per hour)."""
+        return self._worker_efficiency
+
+    @worker_efficiency.setter
+    def worker_efficiency(self, value: float):
+        self._worker_efficiency = self.validate_cost_input("worker_efficiency", value)
+        self.update_labor_cost()
+
+    @property
+    def raw_mat_cost(self) -> float:
+        """The cost of raw materials per unit produced."""
+        return self._raw_mat_cost
+
+    @raw_mat_cost.setter
+    def raw_mat_cost(self, value: float):
+        self._raw_mat_cost = self.validate_cost_input("raw_mat_cost", value)
+        self._variable_cost_step = -1  # variable cost needs to be recalculated
+
+    @property
+    def fixed_cost(self) -> float:
+        """
+        The fixed cost incurred by this industry per time step.
+        Shorthand value used for testing. Will eventually be phased out in favor of calls to
+        get_fixed_cost, which will work similarly to get_variable_cost.
+        """
+        return self._fixed_cost
+
+    @fixed_cost.setter
+    def fixed_cost(self, value: float):
+        self._fixed_cost = value
+        self._fixed_cost_naive_step = -1  # fixed cost needs to be recalculated
+
+    def change_policies(self) -> None:
+        """
+        Marks the costs derived from the model's policies as out of date.
+        Called by the model whenever its policies are replaced.
+        """
+        self._raw_mat_cost_modifier_step = -1
+        self._variable_cost_step = -1  # variable cost needs to be recalculated
+        self._fixed_cost_naive_step = -1  # fixed cost needs to be recalculated
+
     def get_employees(self) -> AgentSet:
         """
         Gets all employees that are employed to this industry.
         """
         return self.model.get_employees(self.industry_type)
 
+    def step(self):
+        """
+        The industry's part of a week: setting its price, producing goods, then changing its employment.
+        Industries don't depend on each other's actions, so all three are done in one pass.
+        """
+        self.determine_price()
+        self.produce_goods()
+        self.change_employment()
+
     def determine_price(self):
         """
         Description:
@@ -157,34 +258,35 @@ class IndustryAgent(Agent):
             self.price == 0
         )  # if simulation is just starting and price is still zero, skip price cap logic
         oldPrice = self.price
-        A = float(self.demand_intercept)
-        B = float(self.demand_slope)
+        A = self.demand_intercept
+        B = self.demand_slope
 
         # variable cost and marginal cost parameters
-        V = float(self.get_variable_cost())  # per-unit variable cost
+        V = self.get_variable_cost()  # per-unit variable cost, already a validated float
         m = V  # MC intercept (constant MC here)
         n = 0.0  # MC slope (zero => constant MC)
 
         # feasible maximum to consider when computing suggested Q:
         # allow selling current inventory plus what production capacity will add this step
         # production capacity is capped by two variables: the number of employees and the total available funds
-        Q_max = int(max(0, self.inventory + self.get_production_capacity()))
+        # both are non-negative ints, so their sum needs no clamping or truncating
+        Q_max = self.inventory + self.get_production_capacity()
 
-        Price = self.price
         Suggested_Quantity = self.inventory
-        F = self.get_fixed_cost_naive()
         # Determine pricing strategy
-        strategy = INDUSTRY_PRICING[self.industry_type]
-        if strategy == PricingType.AVG_COST:
-            Suggested_Quantity = avg_cost(A, B, V, float(F))
-        elif strategy == PricingType.LINEAR_PROFIT_MAX:
+        strategy = self.pricing_strategy
+        if strategy is PricingType.AVG_COST:
+            F = self.get_fixed_cost_naive()  # only average cost pricing depends on fixed cost
+            Suggested_Quantity = avg_cost(A, B, V, F)
+        elif strategy is PricingType.LINEAR_PROFIT_MAX:
             Suggested_Quantity = linear_profit_max(A, B, m, n)
 
         # ensure suggested quantity is feasible and non-negative, clamp to [0, Q_max]
-        if Suggested_Quantity is None:
+        # (Q_max is never negative, so at most one bound can apply)
+        if Suggested_Quantity is None or Suggested_Quantity < 0:
             Suggested_Quantity = 0
-
-        Suggested_Quantity = float(max(0, min(Suggested_Quantity, Q_max)))
+        elif Suggested_Quantity > Q_max:
+            Suggested_Quantity = Q_max
         # TODO: Implement Logic here to hire more employees if the max_production_capacity is too small to accomodate suggested quantity
         # Note: don't just look at Q_max here, as this number also takes into account if there's insufficient funds to produce at the suggested quantity
         # Instead, just factor in max capacity based on a 40 hour work week with all current employees
@@ -210,10 +312,13 @@ class IndustryAgent(Agent):
                     Suggested_Quantity = 0
                 else:
                     Suggested_Quantity = quantity_from_price(A, B, Price)
-        # set results on the instance
-        self.price = float(Price)
+        # set results on the instance; demand parameters and the old price are always floats,
+        # so the price is one too
+        self.price = Price
         # inventory_available_this_step is how many units are expected to be available to sell this step
-        self.inventory_available_this_step = round(Suggested_Quantity)
+        # every pricing helper returns whole units and Q_max is an int, so no rounding is needed,
+        # but the price cap's quantity can still be negative, so clamp it again
+        self.inventory_available_this_step = max(0, Suggested_Quantity or 0)
 
     def produce_goods(self):
         """
@@ -256,44 +361,48 @@ class IndustryAgent(Agent):
             self.goods_produced = 0
             return
 
-        variable_cost_per_unit = self.get_variable_cost()
-        total_variable_cost = variable_cost_per_unit * quantity_to_produce
-
+        num_employees = self.num_employees
+        units_per_hour = num_employees * self.worker_efficiency  # across all employees
         hours_worked = (
-            quantity_to_produce / (self.num_employees * self.worker_efficiency)
-            if self.num_employees * self.worker_efficiency > 0
-            else 0
+            quantity_to_produce / units_per_hour if units_per_hour > 0 else 0
         )
-        total_hours_worked = hours_worked * self.num_employees
-        total_full_hours = self.num_employees * 40
-        hours_cut = total_full_hours - total_hours_worked
-
         self.hours_worked = hours_worked  # update hours worked for each employee this tick.  Assume equal number of hours for each employee for now
 
-        if hours_cut >= 40:
-            logging.info(
-                f"Total employee work hours reduced by {hours_cut:.1f} to meet production quota."
-            )
-            # TODO If the number of hours needed can consistently be accomplished by fewer employees, trigger firing.  (call change_employment here!)
+        # TODO If the number of hours needed can consistently be accomplished by fewer employees, trigger firing.  (call change_employment here!)
 
         # Update inventory and deduct costs
         self.inventory += quantity_to_produce
         self.goods_produced = quantity_to_produce
-        spent_variable = variable_cost_per_unit * quantity_to_produce
+        spent_variable = self.get_variable_cost() * quantity_to_produce
         self.total_cost = Fixed + spent_variable
-        self.balance = self.balance - self.total_cost
-        logging.info(
-            f"Produced {quantity_to_produce:.2f} units; spent_variable={spent_variable:.2f}; "
-            f"spent_fixed={Fixed:.2f}; remaining funds {self.balance:.2f}; "
-            f"total_hours_worked={quantity_to_produce:.1f}"
-        )
+        self.balance -= self.total_cost
+
+        # hours are only reported, so skip working them out when the report would be dropped
+        if logger.isEnabledFor(logging.INFO):
+            total_hours_worked = hours_worked * num_employees
+            total_full_hours = num_employees * 40
+            hours_cut = total_full_hours - total_hours_worked
+            if hours_cut >= 40:
+                logger.info(
+                    "Total employee work hours reduced by %.1f to meet production quota.",
+                    hours_cut,
+                )
+            logger.info(
+                "Produced %.2f units; spent_variable=%.2f; spent_fixed=%.2f; "
+                "remaining funds %.2f; total_hours_worked=%.1f",
+                quantity_to_produce,
+                spent_variable,
+                Fixed,
+                self.balance,
+                total_hours_worked,
+            )
 
     def change_employment(self):
         """
         How the industry will change their employees, whether it be by hiring more, firing more,
         or changing the wages.
         """
-        logging.info("Changing employment...NOT IMPLEMENTED")
+        logger.info("Changing employment...NOT IMPLEMENTED")
         # TODO: Implement industry employment logic
         # deals with potentially firing or hiring employees, and wage changes
         # should call determine_wages at some point
@@ -303,7 +412,7 @@ class IndustryAgent(Agent):
         """
         How the industry will determine what to set their hiring wages at.
         """
-        logging.info("Changing wages...NOT IMPLEMENTED")
+        logger.info("Changing wages...NOT IMPLEMENTED")
         minimum_wage = self.model.policies["minimum_wage"]
         if minimum_wage is not None and self.offered_wage < minimum_wage:
             self.offered_wage = minimum_wage
@@ -317,6 +426,9 @@ class IndustryAgent(Agent):
 
             If efficiency <= 0, return float('inf') to signal that per-unit cost is undefined
             (production is impossible / infeasible).
+
+            The result is reused for the rest of the step, unless one of the inputs or the
+            model's policies are replaced.
         Required Inputs:
             self.offered_wage (float): hourly wage of employees
             self.worker_efficiency (float): goods produced per employee, per hour
@@ -325,45 +437,52 @@ class IndustryAgent(Agent):
             variable_cost (float): variable cost per unit
 
         """
-        try:
-            ow = float(self.offered_wage)
-            eff = float(self.worker_efficiency)
-            rm = float(self.raw_mat_cost)
-        except Exception as exc:
-            raise ValueError(
-                "offered_wage, worker_efficiency, raw_mat_cost must be numeric"
-            ) from exc
-
-        # detect NaN / Inf early
-        if any(math.isnan(x) for x in (ow, eff, rm)):
-            raise ValueError("NaN encountered in cost inputs")
-        if any(math.isinf(x) for x in (ow, eff, rm)):
-            raise ValueError("Infinite cost/input encountered")
+        if self._variable_cost_step == self.model.steps:
+            return self._variable_cost
 
-        if eff <= 0.0:
+        # inputs are validated when they are set, and the labor cost is kept up to date with them,
+        # so the only check needed is whether production is possible at all
+        labor_cost = self._labor_cost
+        if labor_cost == inf:
             # semantics: if eff==0 we cannot produce — treat per-unit cost as infinite
-            return float("inf")
-
-        # Tariffs/Subsidies logic, treated as direct opposites of one another for now
-        # Both modify the cost of raw materials, which is then fed into the variable cost calculation
-        # subsidies and tariffs treated as percentages
-        subsidies = self.model.policies["subsidies"][self.industry_type]
-        tariffs = self.model.policies["tariffs"][self.industry_type]
-        rawMaterialCostModifier = 0.0
-        if subsidies is not None:
-            rawMaterialCostModifier -= (
-                subsidies  # subsidies reduce the cost of raw materials
-            )
-        if tariffs is not None:
-            rawMaterialCostModifier += (
-                tariffs  # Tariffs increase the cost of raw materials
-            )
+            variable_cost = inf
+        else:
+            rm = self._raw_mat_cost
+            variable_cost = labor_cost + (rm + rm * self.get_raw_mat_cost_modifier())
 
-        rm += rm * rawMaterialCostModifier
+        self._variable_cost = variable_cost
+        self._variable_cost_step = self.model.steps
+        return variable_cost
 
-        variable_cost = (ow / eff) + rm
+    def get_raw_mat_cost_modifier(self) -> float:
+        """
+        Description:
+            Return the tariffs/subsidies modifier on raw material cost, as a percentage.
 
-        return variable_cost
+            Policies are looked up once per step, or again if the model's policies are
+            replaced. Changes made to the policies in place take effect next step.
+        Returns:
+            raw_mat_cost_modifier (float): tariffs minus subsidies for this industry
+        """
+        if self._raw_mat_cost_modifier_step != self.model.steps:
+            # Tariffs/Subsidies logic, treated as direct opposites of one another for now
+            # Both modify the cost of raw materials, which is then fed into the variable cost calculation
+            # subsidies and tariffs treated as percentages
+            subsidies = self.model.policies["subsidies"][self.industry_type]
+            tariffs = self.model.policies["tariffs"][self.industry_type]
+            rawMaterialCostModifier = 0.0
+            if subsidies is not None:
+                rawMaterialCostModifier -= (
+                    subsidies  # subsidies reduce the cost of raw materials
+                )
+            if tariffs is not None:
+                rawMaterialCostModifier += (
+                    tariffs  # Tariffs increase the cost of raw materials
+                )
+
+            self._raw_mat_cost_modifier = rawMaterialCostModifier
+            self._raw_mat_cost_modifier_step = self.model.steps
+        return self._raw_mat_cost_modifier
 
     # def get_fixed_cost(self):
     #     """
@@ -387,14 +506,21 @@ class IndustryAgent(Agent):
         This function will directly apply the property tax modifier to the fixed cost value.
 
         This function will eventually be removed in favor of get_fixed_cost
+        It is calculated once per step, or again if the fixed cost or the model's policies are
+        replaced. Changes made to the policies in place take effect next step.
         returns:
             naive_fixed_cost (float)
         """
+        if self._fixed_cost_naive_step == self.model.steps:
+            return self._fixed_cost_naive
 
+        property_cost = 0.0
         property_tax = self.model.policies["property_tax"]["commercial"]
         if property_tax is not None:
-            property_cost = self.fixed_cost * property_tax
-        return self.fixed_cost + property_cost
+            property_cost = self._fixed_cost * property_tax
+        self._fixed_cost_naive = self._fixed_cost + property_cost
+        self._fixed_cost_naive_step = self.model.steps
+        return self._fixed_cost_naive
 
     def get_production_capacity(self):
         """
@@ -423,50 +549,33 @@ class IndustryAgent(Agent):
                                        or the min of fund cap and worker cap
 
         """
-        Fixed = self.get_fixed_cost_naive()
-
         # worker_limit: how many units can workers produce this period
         # (num_employees * efficiency * hours_per_worker); hours assumed 40 here
-        # clamp at zero and floor to int
+        # truncate to int (same as floor for non-negative values) and clamp at zero
         worker_capacity_raw = self.num_employees * self.worker_efficiency * 40
-        worker_limit = int(max(0, math.floor(worker_capacity_raw)))
-
-        # handle no worker capacity quickly
-        if worker_limit <= 0:
-            return 0
+        worker_limit = max(0, int(worker_capacity_raw))
 
         # If industry is allowed to go into debt, skip funds limit check
         if self.debt_allowed:
             return worker_limit
-        else:
-            variable_cost_per_unit = self.get_variable_cost()
-
-            # Validate variable_cost_per_unit BEFORE dividing
-            # Accept only positive, finite costs
-            if (
-                not math.isfinite(variable_cost_per_unit)
-                or variable_cost_per_unit <= 0.0
-            ):
-                # If cost is infinite / undefined -> no funds-based production possible
-                # If cost <= 0 (shouldn't happen) treat as no funds bound (or choose worker_limit)
-                # Here we'll treat as funds_limit = 0 for safety (you can change policy)
-                funds_limit = 0
-            else:
-                # compute funds_limit safely — protect against unreasonable huge values
-                funds_limit_raw = (self.balance - Fixed) / variable_cost_per_unit
-                # if funds_limit_raw is not finite for some reason, fall back to 0
-                if not math.isfinite(funds_limit_raw):
-                    funds_limit = 0
-                else:
-                    # clamp to a sensible integer range before floor to avoid overflow
-                    # e.g., prevent converting > maxsize ints (though Python int is unbounded, math.floor can choke on inf)
-                    funds_limit = int(max(0, math.floor(funds_limit_raw)))
-                if Fixed > self.balance:
-                    funds_limit = 0
-                    # TODO add handler for if fixed cost is more than total money -> Bankruptcy imminent!
 
-            # final capacity is the min of worker limit and funds limit
-            return min(worker_limit, funds_limit)
+        # funds_limit: how many units the remaining funds can pay for.
+        # If cost is infinite / undefined (e.g. no efficiency), the division gives 0, so no
+        # funds-based production is possible. If cost <= 0 (shouldn't happen), treat funds_limit
+        # as 0 for safety.
+        # only the funds limit depends on the fixed cost, so it isn't needed when debt is allowed
+        Fixed = self.get_fixed_cost_naive()
+        variable_cost_per_unit = self.get_variable_cost()
+        funds_limit_raw = (
+            (self.balance - Fixed) / variable_cost_per_unit
+            if variable_cost_per_unit > 0.0
+            else 0.0
+        )
+        # final capacity is the min of worker limit and funds limit.
+        # clamping to [0, worker_limit] before truncating covers no worker capacity, a negative
+        # limit (fixed cost is more than total money), an overflowing one, and NaN.
+        # TODO add handler for if fixed cost is more than total money -> Bankruptcy imminent!
+        return int(max(0.0, min(funds_limit_raw, worker_limit)))
 
     def set_demand_graph_params(self, A: float, B: float):
         """
@@ -479,8 +588,9 @@ class IndustryAgent(Agent):
             self.demand_intercept
             self.demand_slope
         """
-        self.demand_intercept = A
-        self.demand_slope = B
+        # stored as floats so pricing never needs to cast them
+        self.demand_intercept = float(A)
+        self.demand_slope = float(B)
 
     def get_weekly_pay(self):
         """
@@ -506,8 +616,10 @@ class IndustryAgent(Agent):
             return
 
         if quantity > self.inventory_available_this_step:
-            logging.error(
-                f"Attempted to sell {quantity} but only have {self.inventory_available_this_step} available for sale."
+            logger.error(
+                "Attempted to sell %s but only have %s available for sale.",
+                quantity,
+                self.inventory_available_this_step,
             )
             return
 
@@ -540,10 +652,10 @@ class IndustryAgent(Agent):
         Summary: deducts corporate tax from profit generated this turn.  Does not deduct anything if profit was zero
         """
         profit = self.get_profit()
-        profit = max(0.0, profit)  # if profit is negative, clamp to zero
+        if profit <= 0:  # nothing is taxed without a profit
+            return
         corporate_income_tax = self.model.policies["corporate_income_tax"][
             self.industry_type
         ]
-        if corporate_income_tax is not None and profit > 0:
-            taxedAmt = profit * corporate_income_tax
-        self.balance -= taxedAmt
+        if corporate_income_tax is not None:
+            self.balance -= profit * corporate_income_tax
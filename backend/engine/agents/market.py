@@ -0,0 +1,145 @@
+from typing import Iterable, Iterator
+from mesa import Model
+import logging
+import numpy as np
+
+from .industry import IndustryAgent
+from .demand import PreferenceLayout, batch_demand_func
+from .tax import batch_income_tax
+from ..types.industry_type import IndustryType
+
+logger = logging.getLogger(__name__)
+
+
+class Market:
+    """
+    A snapshot of the goods available to PersonAgents this week and their demand for them.
+
+    It is built once per step and shared by every PersonAgent. The industries, tax-inclusive
+    prices, the CES demand and the income tax of all consumers are then computed in one batch,
+    instead of once per agent.
+
+    Attributes:
+        industries (dict): The industry agent selling each industry type.
+        effective_prices (dict): The price of each industry type's goods, including sales tax.
+        layout (PreferenceLayout): The flattened preferences of the consumers.
+        income_taxes (list): The income tax owed by each consumer this week, in layout row order.
+        purchases (list): The purchases made this week, if they are being logged.
+    """
+
+    industries: dict[IndustryType, IndustryAgent]
+    """The industry agent selling each industry type."""
+    effective_prices: dict[IndustryType, float]
+    """The price of each industry type's goods, including sales tax."""
+    layout: PreferenceLayout
+    """The flattened preferences of the consumers."""
+    income_taxes: list[float]
+    """The income tax owed by each consumer this week, in layout row order."""
+    purchases: list[tuple[int, int, IndustryType]] | None
+    """The (consumer id, units, industry type) of each purchase this week, or None if they aren't logged."""
+
+    def __init__(
+        self,
+        model: Model,
+        consumers: Iterable,
+        layout: PreferenceLayout | None = None,
+    ):
+        """
+        Computes this week's prices and the demand of every consumer.
+
+        Args:
+            model (Model): The model whose industries and policies are used.
+            consumers (Iterable): The PersonAgents shopping this week.
+            layout (PreferenceLayout, optional): The consumers' preferences, built from the same
+                consumers in the same order. Built here if not given.
+        """
+        sales_tax = model.policies["sales_tax"]
+        self.industries = {
+            agent.industry_type: agent
+            for agent in model.agents_by_type[IndustryAgent]
+        }
+        self.effective_prices = {
+            itype: agent.price * (1 + sales_tax[itype])
+            for itype, agent in self.industries.items()
+        }
+
+        consumers = list(consumers)
+        self.layout = layout if layout is not None else PreferenceLayout(consumers)
+        prices = np.array(
+            [
+                self.effective_prices.get(itype, np.nan)
+                for itype in self.layout.industry_types
+            ],
+            dtype=np.float64,
+        )
+        sigmas = np.array([consumer.sigma for consumer in consumers], dtype=np.float64)
+        budgets = np.array(
+            [consumer.determine_budget() for consumer in consumers], dtype=np.float64
+        )
+
+        demands = batch_demand_func(sigmas, budgets, self.layout, prices)
+        # plain python lists are much cheaper to slice per agent than numpy arrays
+        self._indptr = self.layout.indptr.tolist()
+        self._goods = [self.layout.industry_types[i] for i in self.layout.goods]
+        self._demands = demands.tolist()
+
+        incomes = np.array([consumer.income for consumer in consumers], dtype=np.float64)
+        self.income_taxes = batch_income_tax(
+            incomes, model.policies["personal_income_tax"]
+        ).tolist()
+        # purchases are only kept when they would actually be logged
+        self.purchases = [] if logger.isEnabledFor(logging.INFO) else None
+
+    def get_demand(self, consumer) -> Iterator[tuple[IndustryType, float]]:
+        """
+        Gets the unrounded quantity of each good a consumer wants to buy this week.
+
+        Args:
+            consumer (PersonAgent): A consumer this market was built for.
+
+        Returns:
+            An iterator of (industry type, quantity) pairs.
+        """
+        row = self.layout.rows[consumer.unique_id]
+        start, end = self._indptr[row], self._indptr[row + 1]
+        return zip(self._goods[start:end], self._demands[start:end])
+
+    def get_income_tax(self, consumer) -> float:
+        """
+        Gets the income tax a consumer owes this week.
+
+        Args:
+            consumer (PersonAgent): A consumer this market was built for.
+
+        Returns:
+            The tax owed on the consumer's income.
+        """
+        return self.income_taxes[self.layout.rows[consumer.unique_id]]
+
+    def record_purchase(self, consumer, units: int, industry_type: IndustryType) -> None:
+        """
+        Records a purchase to be logged with the rest of the week's purchases.
+
+        Args:
+            consumer (PersonAgent): The consumer that made the purchase.
+            units (int): The number of units bought.
+            industry_type (IndustryType): The industry the units were bought from.
+        """
+        if self.purchases is not None:
+            self.purchases.append((consumer.unique_id, units, industry_type))
+
+    def log_purchases(self) -> None:
+        """
+        Logs all recorded purchases as a single record, instead of one record per purchase.
+        """
+        if self.purchases:
+            logger.info(
+                "%s purchases made using saved funds:\n%s",
+                len(self.purchases),
+                "\n".join(
+                    f"Agent {consumer_id} purchased {units} units of {industry_type}"
+                    for consumer_id, units, industry_type in self.purchases
+                ),
+            )
+        if self.purchases is not None:
+            self.purchases = []
@@ -1,10 +1,13 @@
 from mesa import Agent, Model
 from .industry import IndustryAgent
-from .demand import demand_func, custom_round
+from .demand import custom_round
+from .market import Market
 from ..types.demographic import Demographic, DEMOGRAPHIC_SIGMAS
 from ..types.industry_type import IndustryType
 import logging
 
+logger = logging.getLogger(__name__)
+
 
 class PersonAgent(Agent):
     """
@@ -23,12 +26,8 @@ class PersonAgent(Agent):
     """Economic class of the person."""
     income: float
     """Weekly income of the person."""
-    employer: IndustryAgent | None
-    """The employer of this person, or None if unemployed."""
     balance: float
     """The total dollars held by this person. Negative indicates debt."""
-    preferences: dict[IndustryType, float]
-    """Spending preferences, mapping industry type to a weight. Must sum to 1."""
     sigma: float
     """The elasticity of substitution associated with the industries."""
 
@@ -47,6 +46,7 @@ class PersonAgent(Agent):
         super().__init__(model)
         self.demographic = demographic
         self.income = income
+        self._employer = None
         self.employer = employer
         self.balance = starting_balance
         self.preferences = preferences
@@ -56,6 +56,32 @@ class PersonAgent(Agent):
             itype: 0.0 for itype in preferences
         }
 
+    @property
+    def employer(self) -> IndustryAgent | None:
+        """The employer of this person, or None if unemployed."""
+        return self._employer
+
+    @employer.setter
+    def employer(self, employer: IndustryAgent | None):
+        old_employer = self._employer
+        self._employer = employer
+        # the model keeps track of who each employer employs
+        self.model.change_employer(self, old_employer, employer)
+
+    @property
+    def preferences(self) -> dict[IndustryType, float]:
+        """
+        Spending preferences, mapping industry type to a weight. Must sum to 1.
+        Assign a new dictionary to change them, so the model knows to update its demand.
+        """
+        return self._preferences
+
+    @preferences.setter
+    def preferences(self, preferences: dict[IndustryType, float]):
+        self._preferences = preferences
+        # the model keeps every consumer's preferences flattened for the market
+        self.model.change_preferences(self)
+
     def deduct_income_tax(self) -> None:
         """Deducts personal income tax from the agent's balance based on their income."""
         personal_income_tax: list = self.model.policies["personal_income_tax"]
@@ -63,8 +89,10 @@ class PersonAgent(Agent):
             return
 
         previous_threshold = float("inf")
-        for bracket in personal_income_tax:
-            # it is assumed that the highest threshold is first
+        # go from the highest threshold down, whatever order the brackets were given in
+        for bracket in sorted(
+            personal_income_tax, key=lambda bracket: bracket["threshold"], reverse=True
+        ):
             threshold = bracket["threshold"]
             rate = bracket["rate"]
 
@@ -78,10 +106,19 @@ class PersonAgent(Agent):
 
             previous_threshold = threshold
 
-    def payday(self) -> None:
-        """Weekly payday(after tax) for the agent based on their income."""
+    def payday(self, income_tax: float | None = None) -> None:
+        """
+        Weekly payday(after tax) for the agent based on their income.
+
+        Args:
+            income_tax (float, optional): The income tax owed this week, if already calculated
+                (e.g. by the market). If None, it is deducted by `deduct_income_tax`.
+        """
         self.balance += self.income
-        self.deduct_income_tax()
+        if income_tax is None:
+            self.deduct_income_tax()
+        else:
+            self.balance -= income_tax
 
     def determine_budget(self) -> float:
         """
@@ -92,47 +129,34 @@ class PersonAgent(Agent):
         budget = self.income
         return max(0.0, budget)  # Must be non-negative
 
-    def purchase_goods(self):
+    def purchase_goods(self, market: Market | None = None):
         """
         Person receives income, then allocates budget by CES.
         Instead of requiring affordability this week, agents save
         per-industry until they can afford a unit.
-        """
-
-        # Receive weekly income
-        self.payday()
 
-        industry_agents = list(self.model.agents_by_type[IndustryAgent])
+        Args:
+            market (Market, optional): This week's market, shared by all PersonAgents,
+                which also logs their purchases. If None, a market is built for just this agent.
+        """
 
-        # sales tax logic; incorporate into person facing prices
-        effective_prices = {
-            agent.industry_type: (
-                agent.price * (1 + self.model.policies["sales_tax"][agent.industry_type])
-            )
-            for agent in industry_agents
-        }
+        own_market = market is None
+        if own_market:
+            market = Market(self.model, [self])
 
-        # Calculate desired purchases
-        desired_quantities = demand_func(
-            sigma=self.sigma,
-            budget=self.determine_budget(),
-            prefs=self.preferences,
-            prices=effective_prices,
-        )
-        #returns an unrounded quantity demand per good
-
-        # For each industry, we add the weekly allocated money into the savings bucket.
-        for industry in industry_agents:
-            itype = industry.industry_type
-            if itype not in desired_quantities:
-                continue
+        # Receive weekly income, taxed at the rate the market calculated
+        self.payday(market.get_income_tax(self))
 
-            q_desired = desired_quantities[itype]
+        # Desired purchases were calculated for everyone at once by the market,
+        # at prices that already include sales tax.
+        # returns an unrounded quantity demand per good
+        for itype, q_desired in market.get_demand(self):
             if q_desired <= 0:
                 continue
+            industry = market.industries[itype]
 
             # allocate money = quantity * price_with_tax
-            price_with_tax = effective_prices[itype]
+            price_with_tax = market.effective_prices[itype]
             allocated_dollars = q_desired * price_with_tax
 
             # add this to the industry-specific savings pool
@@ -142,7 +166,6 @@ class PersonAgent(Agent):
             savings_bucket = self.industry_savings[itype]
             if savings_bucket <= 0:
                 continue
-            price_with_tax = effective_prices[itype]  # price including sales tax
 
             # Check if agent saved enough to buy at least 1 unit
             if savings_bucket < price_with_tax:
@@ -167,10 +190,10 @@ class PersonAgent(Agent):
             self.balance -= total_cost
             industry.sell_goods(purchasable_units)
 
-            logging.info(
-                f"Agent {self.unique_id} purchased {purchasable_units} units of "
-                f"{industry.industry_type} using saved funds."
-            )
+            market.record_purchase(self, purchasable_units, itype)
+
+        if own_market:
+            market.log_purchases()
 
     def change_employment(self):
         """
@@ -179,7 +202,7 @@ class PersonAgent(Agent):
         """
         self.income = self.income + 1
         if self.employer is not None:
-            logging.info("Already employed, no action taken.")
+            logger.info("Already employed, no action taken.")
             return
 
         # TODO: Implement person employment logic
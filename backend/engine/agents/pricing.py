@@ -1,4 +1,4 @@
-import math
+from math import sqrt
 from typing import Optional
 
 def solve_quadratic_choose_higher(B: float, V: float, A: float, F: float) -> Optional[float]:
@@ -28,10 +28,11 @@ def solve_quadratic_choose_higher(B: float, V: float, A: float, F: float) -> Opt
         q = -b / (2*a)
         return q
     else:    #two real roots
-        sqrt_disc = math.sqrt(disc)
-        q1 = (-b + sqrt_disc) / (2*a)
-        q2 = (-b - sqrt_disc) / (2*a)
-        return max(q1, q2)
+        sqrt_disc = sqrt(disc)
+        # the higher root takes +sqrt when a > 0 and -sqrt when a < 0, so only it is computed
+        if a > 0:
+            return (-b + sqrt_disc) / (2*a)
+        return (-b - sqrt_disc) / (2*a)
 
 
 #Nondiagnostic version: only returns price and quantity
@@ -146,9 +147,11 @@ def quantity_from_price(A,B,P) -> int:
         P (float): Price that good is to be sold at
 
     Returns:
-        int: quantity that industry will produce at this price
+        int: quantity that industry will produce at this price.
+            0 if B is 0, as a flat demand graph gives no quantity for a price.
     """
-    if B != 0:
-        Q_at_P = (A - P) / B
-        return round(Q_at_P)  #round to whole number
+    if B == 0:
+        return 0
+    Q_at_P = (A - P) / B
+    return round(Q_at_P)  #round to whole number
     
\ No newline at end of file
@@ -18,8 +18,9 @@ def calculate_unemployment(model: Model) -> float:
     if total == 0:
         return 0.0
     
-    unemployed = len(peopleAgents.select(lambda agent: (agent.employer is None)))
-    return unemployed / total
+    # the model keeps track of everyone employed, so there's no need to scan the population
+    employed = sum(len(employees) for employees in model.employees.values())
+    return (total - employed) / total
 
 
 def calculate_gdp(model: Model) -> float:
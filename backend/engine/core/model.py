@@ -5,6 +5,8 @@ from mesa.datacollection import DataCollector
 
 from ..agents.person import PersonAgent
 from ..agents.industry import IndustryAgent
+from ..agents.market import Market
+from ..agents.demand import PreferenceLayout
 from ..types.industry_type import IndustryType
 from ..types.demographic import Demographic
 from ..types.indicators import Indicators
@@ -46,12 +48,20 @@ class EconomyModel(Model):
 
     # Changeable by the user at any time
 
-    policies: dict[str, float | dict[IndustryType | Demographic, float]]
-    """A dictionary of the various policies available to change in the simulation. Needs to match policies_schema."""
-
     week: int
     """The current week in the simulation."""
 
+    # Derived from the agents, rebuilt when PersonAgents are added or removed
+
+    consumers: list[PersonAgent]
+    """The PersonAgents, in the row order of consumer_preferences."""
+
+    consumer_preferences: PreferenceLayout | None
+    """The flattened preferences of all PersonAgents, or None if they need to be flattened again."""
+
+    employees: dict[IndustryAgent, dict[PersonAgent, None]]
+    """The PersonAgents employed by each employer, kept up to date as PersonAgents change employers."""
+
     def __init__(
         self,
         max_simulation_length: int,
@@ -63,6 +73,9 @@ class EconomyModel(Model):
         random_events: bool = False,
     ):
         super().__init__()
+        self.consumers = []
+        self.consumer_preferences = None
+        self.employees = {}
 
         if max_simulation_length <= 0:
             raise ValueError("Maximum simulation length must be positive.")
@@ -226,6 +239,81 @@ class EconomyModel(Model):
                 starting_debt_allowed=industry_info.get("starting_debt_allowed", False),
             )
 
+    def register_agent(self, agent) -> None:
+        super().register_agent(agent)
+        if isinstance(agent, PersonAgent):
+            self.consumer_preferences = None
+
+    def deregister_agent(self, agent) -> None:
+        super().deregister_agent(agent)
+        if isinstance(agent, PersonAgent):
+            self.consumer_preferences = None
+            self.change_employer(agent, agent.employer, None)
+
+    def change_employer(
+        self,
+        person: PersonAgent,
+        old_employer: IndustryAgent | None,
+        new_employer: IndustryAgent | None,
+    ) -> None:
+        """
+        Updates the employees of each employer when a PersonAgent changes employers.
+        Called by PersonAgent whenever its employer is set.
+
+        Args:
+            person (PersonAgent): The PersonAgent whose employer changed.
+            old_employer (IndustryAgent | None): Their previous employer, or None if they were unemployed.
+            new_employer (IndustryAgent | None): Their new employer, or None if they are now unemployed.
+        """
+        if old_employer is not None:
+            employees = self.employees[old_employer]
+            del employees[person]
+            if not employees:
+                del self.employees[old_employer]
+        if new_employer is not None:
+            self.employees.setdefault(new_employer, {})[person] = None
+
+    def change_preferences(self, person: PersonAgent) -> None:
+        """
+        Marks the flattened preferences of the PersonAgents as out of date.
+        Called by PersonAgent whenever its preferences are set.
+
+        Args:
+            person (PersonAgent): The PersonAgent whose preferences changed.
+        """
+        self.consumer_preferences = None
+
+    @property
+    def policies(self) -> dict[str, float | dict[IndustryType | Demographic, float]]:
+        """
+        A dictionary of the various policies available to change in the simulation. Needs to match policies_schema.
+        Assign a new dictionary to change them during a step. Changes made to it in place take effect next step.
+        """
+        return self._policies
+
+    @policies.setter
+    def policies(
+        self, policies: dict[str, float | dict[IndustryType | Demographic, float]]
+    ):
+        self._policies = policies
+        # the industries look up their policy-derived costs once per step
+        for industry in self.agents_by_type.get(IndustryAgent, []):
+            industry.change_policies()
+
+    def get_market(self) -> Market:
+        """
+        Gets this week's market for all PersonAgents. Their preferences are only flattened
+        again if PersonAgents were added or removed, or their preferences changed, since the
+        last call.
+
+        Returns:
+            Market: The market, with every PersonAgent's demand already calculated.
+        """
+        if self.consumer_preferences is None:
+            self.consumers = list(self.agents_by_type[PersonAgent])
+            self.consumer_preferences = PreferenceLayout(self.consumers)
+        return Market(self, self.consumers, self.consumer_preferences)
+
     def get_employees(self, industry: IndustryType) -> AgentSet:
         """
         Gets all employees that are employed to the specified industry.
@@ -236,12 +324,13 @@ class EconomyModel(Model):
         Returns:
             AgentSet: An AgentSet of PersonAgents employed in the specified industry.
         """
-        peopleAgents = self.agents_by_type[PersonAgent]
-        return peopleAgents.select(
-            lambda agent: (
-                agent.employer is not None and agent.employer.industry_type == industry
-            )
-        )
+        employees = [
+            person
+            for employer, employer_employees in self.employees.items()
+            if employer.industry_type == industry
+            for person in employer_employees
+        ]
+        return AgentSet(employees, random=self.random)
 
     def inflation(self) -> None:
         """
@@ -266,9 +355,7 @@ class EconomyModel(Model):
 
         # industry agents do their tasks
         industryAgents = self.agents_by_type[IndustryAgent]
-        industryAgents.shuffle_do("determine_price")
-        industryAgents.shuffle_do("produce_goods")
-        industryAgents.shuffle_do("change_employment")
+        industryAgents.shuffle_do("step")
 
         # people agents do their tasks
         peopleAgents = self.agents_by_type[PersonAgent]
@@ -276,7 +363,9 @@ class EconomyModel(Model):
         median_income = indicators_df["Median Income"].iloc[-1]
 
         peopleAgents.do("update_class", median_income)
-        peopleAgents.shuffle_do("purchase_goods")
+        market = self.get_market()
+        peopleAgents.shuffle_do("purchase_goods", market)
+        market.log_purchases()
         peopleAgents.shuffle_do("change_employment")
 
         # collect info for this week
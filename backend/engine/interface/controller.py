@@ -26,8 +26,12 @@ class ModelController:
     next_id: int = 1
     """The next available model ID."""
 
+    query_cache: dict[int, dict[tuple, pd.DataFrame]] = {}
+    """A dictionary mapping model IDs to their cached query results. Cleared whenever that model steps."""
+
     def __init__(self):
         self.models = {}
+        self.query_cache = {}
 
     def create_model(
         self,
@@ -94,6 +98,7 @@ class ModelController:
 
         if model_id in self.models:
             del self.models[model_id]
+            self.query_cache.pop(model_id, None)
         else:
             raise ValueError(f"Model with ID {model_id} does not exist.")
 
@@ -109,6 +114,8 @@ class ModelController:
             ValueError: If the model associated with the model_id does not exist.
         """
         model = self.get_model(model_id)
+        # any stepping may change the collected data, so cached queries are stale
+        self.query_cache.pop(model_id, None)
         if time < 0:
             for _ in range(abs(time)):
                 model.reverse_step()
@@ -201,6 +208,13 @@ class ModelController:
 
         model = self.get_model(model_id)
 
+        # read the industries once, as they're used for both the cache key and the filter
+        industries = tuple(industries) if industries else None
+        cache_key = ("industry_data", start_time, end_time, industries)
+        cached_df = self.get_cached_query(model_id, cache_key)
+        if cached_df is not None:
+            return cached_df
+
         industries_df: pd.DataFrame = model.datacollector.get_agenttype_vars_dataframe(
             IndustryAgent
         )
@@ -232,6 +246,7 @@ class ModelController:
         if industries:
             industries_df = industries_df[industries_df["industry"].isin(industries)]
 
+        self.set_cached_query(model_id, cache_key, industries_df)
         return industries_df
 
     def get_demo_metrics(
@@ -262,6 +277,9 @@ class ModelController:
         # parameter validation
         if start_time < 0 or end_time < 0 or (end_time != 0 and end_time < start_time):
             raise ValueError("Invalid start_time or end_time values.")
+        # read the metrics once, as they're used for validation, the cache key and the filter
+        if demo_metrics is not None:
+            demo_metrics = tuple(demo_metrics)
         if demo_metrics is not None and not all(
             ind in DemoMetrics.values() for ind in demo_metrics
         ):
@@ -270,6 +288,12 @@ class ModelController:
             )
 
         model = self.get_model(model_id)
+
+        cache_key = ("demo_metrics", start_time, end_time, demo_metrics or None)
+        cached_df = self.get_cached_query(model_id, cache_key)
+        if cached_df is not None:
+            return cached_df
+
         metrics_df: pd.DataFrame = model.datacollector.get_model_vars_dataframe()
 
         # filter by time
@@ -294,7 +318,9 @@ class ModelController:
                 DemoMetrics.STD_BALANCE,
                 DemoMetrics.AVERAGE_WAGE,
             ]
-            return pd.DataFrame(columns=final_columns)
+            metrics_df = pd.DataFrame(columns=final_columns)
+            self.set_cached_query(model_id, cache_key, metrics_df)
+            return metrics_df
 
         # Turn metrics from dicts to values with demo column
         metrics_df = (
@@ -312,6 +338,7 @@ class ModelController:
             inplace=True,
         )
 
+        self.set_cached_query(model_id, cache_key, metrics_df)
         return metrics_df
 
     def get_indicators(
@@ -374,6 +401,36 @@ class ModelController:
 
         return indicators_df
 
+    def get_cached_query(self, model_id: int, key: tuple) -> pd.DataFrame | None:
+        """
+        Retrieve a cached query result for the specified model.
+
+        Args:
+            model_id (int): The unique identifier for the model the query was made on.
+            key (tuple): The key identifying the query and its arguments.
+
+        Returns:
+            dataframe (DataFrame | None): A copy of the cached result, or None if it is not cached.
+        """
+        cached_df = self.query_cache.get(model_id, {}).get(key)
+        if cached_df is None:
+            return None
+        # hand out a copy so callers can't modify the cached result
+        return cached_df.copy()
+
+    def set_cached_query(self, model_id: int, key: tuple, df: pd.DataFrame) -> None:
+        """
+        Cache a query result for the specified model until it is next stepped.
+        The result is stored as is rather than copied, so it must not be modified in place
+        afterwards; later lookups get copies of it.
+
+        Args:
+            model_id (int): The unique identifier for the model the query was made on.
+            key (tuple): The key identifying the query and its arguments.
+            df (DataFrame): The result of the query.
+        """
+        self.query_cache.setdefault(model_id, {})[key] = df
+
     def get_model(self, model_id: int) -> EconomyModel:
         """
         Retrieve the specified model.
@@ -33,6 +33,12 @@ class MockEconomyModel(Model):
     def get_employees(self, industry_type: IndustryType) -> AgentSet:
         return self.MOCK_EMPLOYEES[industry_type]
 
+    def change_employer(self, person, old_employer, new_employer) -> None:
+        pass
+
+    def change_preferences(self, person) -> None:
+        pass
+
 
 @pytest.fixture()
 def mock_economy_model(policies) -> MockEconomyModel:
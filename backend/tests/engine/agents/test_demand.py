@@ -1,5 +1,12 @@
+from types import SimpleNamespace
+import numpy as np
 from engine.types.industry_type import IndustryType
-from engine.agents.demand import demand_func, custom_round
+from engine.agents.demand import (
+    demand_func,
+    custom_round,
+    PreferenceLayout,
+    batch_demand_func,
+)
 from pytest import approx, mark, param
 
 
@@ -61,3 +68,51 @@ def test_demand_func(
     for industry, demand in demands.items():
         assert demand == approx(expected[industry])
         
+
+
+def test_batch_demand_func():
+    """
+    Tests that `batch_demand_func` matches `demand_func` for consumers with differing
+    preference sets, including a good that is not for sale.
+    """
+    consumers = [
+        SimpleNamespace(
+            unique_id=1,
+            sigma=1.0,
+            budget=1000.0,
+            preferences={IndustryType.ENTERTAINMENT: 0.6, IndustryType.GROCERIES: 0.4},
+        ),
+        SimpleNamespace(
+            unique_id=2,
+            sigma=0.5,
+            budget=250.0,
+            preferences={
+                IndustryType.GROCERIES: 0.2,
+                IndustryType.UTILITIES: 0.5,
+                IndustryType.LUXURY: 0.3,
+            },
+        ),
+        SimpleNamespace(unique_id=3, sigma=2.0, budget=50.0, preferences={}),
+    ]
+    prices = {
+        IndustryType.ENTERTAINMENT: 10.0,
+        IndustryType.GROCERIES: 25.0,
+        IndustryType.UTILITIES: 40.0,
+    }
+
+    layout = PreferenceLayout(consumers)
+    demands = batch_demand_func(
+        np.array([consumer.sigma for consumer in consumers]),
+        np.array([consumer.budget for consumer in consumers]),
+        layout,
+        np.array([prices.get(itype, np.nan) for itype in layout.industry_types]),
+    )
+
+    for consumer in consumers:
+        expected = demand_func(
+            consumer.sigma, consumer.budget, consumer.preferences, prices
+        )
+        row = layout.rows[consumer.unique_id]
+        start, end = layout.indptr[row], layout.indptr[row + 1]
+        for good, demand in zip(layout.goods[start:end], demands[start:end]):
+            assert demand == approx(expected.get(layout.industry_types[good], 0.0))
@@ -1,5 +1,6 @@
 import pytest
 import math
+from engine.agents import industry as industry_module
 from engine.agents.industry import IndustryAgent
 from engine.types.industry_type import IndustryType
 
@@ -126,9 +127,35 @@ def test_determine_price_avg_cost(mock_economy_model):
     ind.determine_price()
     ind.produce_goods()  # Should produce 200 units, which is the break-even quantity
     assert ind.inventory_available_this_step == 200
+    assert isinstance(ind.inventory_available_this_step, int)
+    assert isinstance(ind.inventory, int)
     assert ind.price == 18.0
 
 
+def test_step(mock_economy_model):
+    """
+    Test that step sets the price and produces goods the same way as calling each phase separately.
+    """
+    industries = [
+        IndustryAgent(
+            mock_economy_model,
+            industry_type=IndustryType.UTILITIES,
+            starting_inventory=0,
+            starting_balance=10000.0,
+            starting_demand_intercept=36.0,
+            starting_demand_slope=0.09,
+        )
+        for _ in range(2)
+    ]
+    industries[0].step()
+    industries[1].determine_price()
+    industries[1].produce_goods()
+    industries[1].change_employment()
+
+    for attribute in ("price", "inventory", "inventory_available_this_step", "balance"):
+        assert getattr(industries[0], attribute) == getattr(industries[1], attribute)
+
+
 """
 Set up production first:
 production = EmpNum * Eff * Hours
@@ -187,6 +214,28 @@ profit = 2805.96 - 2002 = $803.96 profit!
 """
 
 
+def test_demand_params_stored_as_floats(mock_economy_model):
+    """
+    Test that integer demand parameters are stored as floats, so the price stays a float.
+    """
+    ind = IndustryAgent(
+        mock_economy_model,
+        industry_type=IndustryType.UTILITIES,
+        starting_price=0,
+        starting_inventory=0,
+        starting_balance=10000.0,
+        starting_demand_intercept=36,
+        starting_demand_slope=1,
+    )
+    assert isinstance(ind.demand_intercept, float)
+    assert isinstance(ind.demand_slope, float)
+    ind.set_demand_graph_params(40, 2)
+    assert isinstance(ind.demand_intercept, float)
+    assert isinstance(ind.demand_slope, float)
+    ind.determine_price()
+    assert isinstance(ind.price, float)
+
+
 def test_determine_price_linear_profit_max(mock_economy_model):
     """
     Test determine_price when pricing strategy is LINEAR_PROFIT_MAX.
@@ -299,6 +348,39 @@ def test_price_cap(
     assert ind.inventory_available_this_step == expected_quantity
 
 
+@pytest.mark.parametrize("capped_quantity", [None, -5])
+def test_price_cap_quantity_clamped(mock_economy_model, monkeypatch, capped_quantity):
+    """
+    Test that an infeasible quantity from the capped price is clamped to zero,
+    instead of being stored as the inventory available this step.
+    """
+    monkeypatch.setitem(
+        mock_economy_model.policies["price_cap"], IndustryType.LUXURY, 0.1
+    )
+    monkeypatch.setitem(
+        mock_economy_model.policies["price_cap_enabled"], IndustryType.LUXURY, True
+    )
+    monkeypatch.setattr(
+        industry_module, "quantity_from_price", lambda A, B, P: capped_quantity
+    )
+    ind = IndustryAgent(
+        mock_economy_model,
+        industry_type=IndustryType.LUXURY,
+        starting_price=20,
+        starting_inventory=0,
+        starting_balance=10000.0,
+        starting_offered_wage=15.0,
+        starting_raw_mat_cost=2.0,
+        starting_number_of_employees=5,
+        starting_worker_efficiency=1.0,
+        starting_demand_intercept=36.0,
+        starting_demand_slope=0.09,
+    )
+    ind.determine_price()
+    assert ind.price == 22
+    assert ind.inventory_available_this_step == 0
+
+
 """
 Try negative val for this:
 (V-A)^2) - 4(B*F)
@@ -468,6 +550,33 @@ def test_get_profit_corpo_tax_realistic(
     assert (ind.balance - 1000000) == pytest.approx(expected_profit)
 
 
+@pytest.mark.parametrize(
+    "corporate_income_tax,total_revenue",
+    [(None, 10000.0), (0.1, 0.0), (0.1, 100.0)],
+)
+def test_no_corpo_tax_deducted(
+    mock_economy_model, monkeypatch, corporate_income_tax, total_revenue
+):
+    """
+    Tests that deduct_corporate_tax leaves the balance alone when there is no profit,
+    or no corporate income tax policy.
+    """
+    monkeypatch.setitem(
+        mock_economy_model.policies["corporate_income_tax"],
+        IndustryType.LUXURY,
+        corporate_income_tax,
+    )
+    ind = IndustryAgent(
+        mock_economy_model,
+        industry_type=IndustryType.LUXURY,
+        starting_balance=1000.0,
+    )
+    ind.total_cost = 500.0
+    ind.total_revenue = total_revenue
+    ind.deduct_corporate_tax()
+    assert ind.balance == 1000.0
+
+
 @pytest.mark.parametrize(
     "property_tax,starting_fixed_cost,expected_fixed_cost",
     [
@@ -497,6 +606,43 @@ def test_fixed_cost_property_tax(
     assert ind.get_fixed_cost_naive() == pytest.approx(expected_fixed_cost)
 
 
+def test_fixed_cost_no_property_tax(mock_economy_model, monkeypatch):
+    """
+    Tests that the fixed cost is unchanged when there is no property tax policy.
+    """
+    monkeypatch.setitem(mock_economy_model.policies["property_tax"], "commercial", None)
+    ind = IndustryAgent(
+        mock_economy_model,
+        industry_type=IndustryType.AUTOMOBILES,
+        starting_fixed_cost=200.0,
+    )
+    assert ind.get_fixed_cost_naive() == 200.0
+
+
+def test_fixed_cost_updated_by_changes(mock_economy_model, monkeypatch):
+    """
+    The fixed cost is reused within a step, but changing it or moving to the next step
+    recalculates it.
+    """
+    property_tax = mock_economy_model.policies["property_tax"]
+    monkeypatch.setitem(property_tax, "commercial", 0.1)
+    ind = IndustryAgent(
+        mock_economy_model,
+        industry_type=IndustryType.AUTOMOBILES,
+        starting_fixed_cost=200.0,
+    )
+    assert ind.get_fixed_cost_naive() == pytest.approx(220.0)
+
+    ind.fixed_cost *= 2  # e.g. inflation, applied before industries act in a step
+    assert ind.get_fixed_cost_naive() == pytest.approx(440.0)
+
+    monkeypatch.setitem(property_tax, "commercial", 0.0)
+    assert ind.get_fixed_cost_naive() == pytest.approx(440.0)
+
+    mock_economy_model.steps += 1
+    assert ind.get_fixed_cost_naive() == pytest.approx(400.0)
+
+
 """
 ===============================================================================
 Test Suite: get_variable_cost()
@@ -524,7 +670,7 @@ Test Coverage:
 
     3. **Invalid Inputs**
         - Non-numeric inputs (e.g., strings).
-        - NaN (Not a Number) or infinite float values should raise ValueError.
+        - NaN (Not a Number) or infinite float values should raise ValueError when set.
 
     4. **Parameterization**
         - All tests use a shared factory method `make_industry_agent()` to create
@@ -536,7 +682,7 @@ Test Coverage:
 Expected Behavior Summary:
     - Returns correct numeric output for feasible inputs.
     - Returns float('inf') when efficiency <= 0.
-    - Raises ValueError when encountering NaN, Inf, or non-numeric values.
+    - Raises ValueError when NaN, Inf, or non-numeric values are set.
 
 ===============================================================================
 """
@@ -609,6 +755,34 @@ def test_subsidies(mock_economy_model, subsidy, expected_variable_cost):
     assert ind.get_variable_cost() == expected_variable_cost
 
 
+def test_tariffs_updated_each_step(mock_economy_model, monkeypatch):
+    """
+    Tariffs/subsidies are looked up once per step, so policy changes apply from the next step.
+    """
+    ind = make_industry_agent(mock_economy_model, 20, 10, 5)
+    assert ind.get_variable_cost() == 7.0
+
+    monkeypatch.setitem(mock_economy_model.policies["tariffs"], IndustryType.LUXURY, 1)
+    assert ind.get_variable_cost() == 7.0
+
+    mock_economy_model.steps += 1
+    assert ind.get_variable_cost() == 12
+
+
+def test_variable_cost_updated_by_cost_changes(mock_economy_model):
+    """
+    The variable cost is reused within a step, but changing a cost input recalculates it.
+    """
+    ind = make_industry_agent(mock_economy_model, 20, 10, 5)
+    assert ind.get_variable_cost() == 7.0
+
+    ind.raw_mat_cost *= 2  # e.g. inflation, applied before industries act in a step
+    assert ind.get_variable_cost() == 12.0
+
+    ind.offered_wage = 40  # e.g. a minimum wage increase from determine_wages
+    assert ind.get_variable_cost() == 14.0
+
+
 def test_normal_case(mock_economy_model):
     ind = make_industry_agent(mock_economy_model, 20, 10, 5)
     assert ind.get_variable_cost() == pytest.approx(7.0)
@@ -635,21 +809,33 @@ def test_negative_efficiency_returns_inf(mock_economy_model):
 
 
 def test_nan_input_raises(mock_economy_model):
-    ind = make_industry_agent(mock_economy_model, 20, float("nan"), 5)
     with pytest.raises(ValueError):
-        ind.get_variable_cost()
+        make_industry_agent(mock_economy_model, 20, float("nan"), 5)
 
 
 def test_inf_input_raises(mock_economy_model):
-    ind = make_industry_agent(mock_economy_model, 20, 10, float("inf"))
     with pytest.raises(ValueError):
-        ind.get_variable_cost()
+        make_industry_agent(mock_economy_model, 20, 10, float("inf"))
 
 
 def test_non_numeric_input_raises(mock_economy_model):
-    ind = make_industry_agent(mock_economy_model, "abc", 10, 5)
     with pytest.raises(ValueError):
-        ind.get_variable_cost()
+        make_industry_agent(mock_economy_model, "abc", 10, 5)
+
+
+def test_invalid_input_set_later_raises(mock_economy_model):
+    ind = make_industry_agent(mock_economy_model, 20, 10, 5)
+    with pytest.raises(ValueError):
+        ind.offered_wage = float("nan")
+    with pytest.raises(ValueError):
+        ind.worker_efficiency = float("inf")
+    with pytest.raises(ValueError):
+        ind.raw_mat_cost = "abc"
+    # rejected values leave the variable cost untouched
+    assert ind.get_variable_cost() == pytest.approx(7.0)
+
+    ind.worker_efficiency = 4
+    assert ind.get_variable_cost() == pytest.approx(10.0)
 
 
 """
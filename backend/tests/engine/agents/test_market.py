@@ -0,0 +1,104 @@
+from pytest import approx
+from engine.agents.demand import demand_func
+from engine.agents.industry import IndustryAgent
+from engine.agents.market import Market
+from engine.agents.person import PersonAgent
+from engine.types.demographic import Demographic
+from engine.types.industry_type import IndustryType
+
+
+def make_market_agents(model) -> tuple[list[IndustryAgent], list[PersonAgent]]:
+    """
+    Creates a few industries and consumers with differing preferences, incomes and
+    demographics, including a preference for an industry that isn't in the market.
+    """
+    industries = [
+        IndustryAgent(model, itype, starting_price=price, starting_inventory=1000)
+        for itype, price in [
+            (IndustryType.GROCERIES, 10.0),
+            (IndustryType.ENTERTAINMENT, 20.0),
+            (IndustryType.HOUSING, 35.0),
+        ]
+    ]
+    for industry in industries:
+        industry.inventory_available_this_step = industry.inventory
+
+    consumers = [
+        PersonAgent(
+            model,
+            Demographic.LOWER_CLASS,
+            preferences={IndustryType.GROCERIES: 0.7, IndustryType.HOUSING: 0.3},
+            income=300,
+        ),
+        PersonAgent(
+            model,
+            Demographic.MIDDLE_CLASS,
+            preferences={
+                IndustryType.GROCERIES: 0.2,
+                IndustryType.ENTERTAINMENT: 0.3,
+                IndustryType.HOUSING: 0.5,
+            },
+            income=800,
+        ),
+        PersonAgent(
+            model,
+            Demographic.UPPER_CLASS,
+            preferences={IndustryType.ENTERTAINMENT: 0.6, IndustryType.LUXURY: 0.4},
+            income=2000,
+        ),
+    ]
+    return industries, consumers
+
+
+def test_market_demand_matches_demand_func(mock_economy_model, monkeypatch):
+    """
+    Tests that the demand calculated for all consumers at once by the market is the same
+    as calling `demand_func` for each consumer.
+    """
+    monkeypatch.setitem(
+        mock_economy_model.policies["sales_tax"], IndustryType.ENTERTAINMENT, 0.1
+    )
+    _, consumers = make_market_agents(mock_economy_model)
+
+    market = Market(mock_economy_model, consumers)
+
+    # only industries in the model are for sale, at prices including sales tax
+    assert market.effective_prices[IndustryType.ENTERTAINMENT] == approx(22.0)
+    assert IndustryType.LUXURY not in market.effective_prices
+    for consumer in consumers:
+        expected = demand_func(
+            consumer.sigma,
+            consumer.determine_budget(),
+            consumer.preferences,
+            market.effective_prices,
+        )
+        demand = dict(market.get_demand(consumer))
+        assert demand.keys() == consumer.preferences.keys()
+        for itype, quantity in demand.items():
+            # goods that aren't for sale aren't demanded
+            assert quantity == approx(expected.get(itype, 0))
+
+
+def test_shared_market_purchases(mock_economy_model):
+    """
+    Tests that purchasing through a market shared by all consumers has the same result
+    as each consumer purchasing through a market of their own.
+    """
+    own_model = mock_economy_model
+    own_industries, own_consumers = make_market_agents(own_model)
+    for consumer in own_consumers:
+        consumer.purchase_goods()
+
+    # a second, separate model of the same kind, so both start from the same state
+    shared_model = type(mock_economy_model)(mock_economy_model.policies)
+    shared_industries, shared_consumers = make_market_agents(shared_model)
+    market = Market(shared_model, shared_consumers)
+    for consumer in shared_consumers:
+        consumer.purchase_goods(market)
+
+    for own, shared in zip(own_consumers, shared_consumers):
+        assert shared.balance == approx(own.balance)
+        assert shared.industry_savings == approx(own.industry_savings)
+    for own, shared in zip(own_industries, shared_industries):
+        assert shared.inventory_available_this_step == own.inventory_available_this_step
+        assert shared.total_revenue == approx(own.total_revenue)
@@ -1,5 +1,7 @@
+import numpy as np
 from pytest import mark, approx
 from engine.agents.person import PersonAgent
+from engine.agents.tax import batch_income_tax
 from engine.types.demographic import Demographic, DEMOGRAPHIC_SIGMAS
 from engine.types.industry_type import IndustryType
 from engine.agents.industry import IndustryAgent
@@ -80,6 +82,106 @@ def test_income_tax(
     assert person.balance == approx(expected_balance)
 
 
+@mark.parametrize(
+    "personal_income_tax",
+    [
+        None,
+        [{"threshold": 0.0, "rate": 0.1}],
+        [
+            {"threshold": 100.0, "rate": 0.3},
+            {"threshold": 50.0, "rate": 0.2},
+            {"threshold": 10.0, "rate": 0.1},
+            {"threshold": 0.0, "rate": 0.0},
+        ],
+        [
+            {"threshold": 0.0, "rate": 0.0},
+            {"threshold": 10.0, "rate": 0.1},
+            {"threshold": 50.0, "rate": 0.2},
+            {"threshold": 100.0, "rate": 0.3},
+        ],
+        [
+            {"threshold": 50.0, "rate": 0.2},
+            {"threshold": 0.0, "rate": 0.0},
+            {"threshold": 100.0, "rate": 0.3},
+            {"threshold": 10.0, "rate": 0.1},
+        ],
+    ],
+)
+def test_batch_income_tax(
+    mock_economy_model, monkeypatch, personal_income_tax: list | None
+):
+    """
+    Tests that `batch_income_tax` matches `deduct_income_tax` for incomes in,
+    between, and exactly at each bracket.
+
+    Args:
+        mock_economy_model: a mock model.
+        personal_income_tax (list | None): the income tax brackets, in any order.
+    """
+    monkeypatch.setitem(
+        mock_economy_model.policies, "personal_income_tax", personal_income_tax
+    )
+    incomes = [0.0, 5.0, 10.0, 30.0, 50.0, 75.5, 100.0, 1000.0]
+
+    expected = []
+    for income in incomes:
+        person = PersonAgent(
+            mock_economy_model,
+            Demographic.MIDDLE_CLASS,
+            preferences={},
+            income=income,
+        )
+        person.deduct_income_tax()
+        expected.append(-person.balance)
+
+    taxes = batch_income_tax(np.array(incomes), personal_income_tax)
+    assert taxes.tolist() == approx(expected)
+
+
+@mark.parametrize(
+    "personal_income_tax",
+    [
+        [
+            {"threshold": 100.0, "rate": 0.3},
+            {"threshold": 50.0, "rate": 0.2},
+            {"threshold": 10.0, "rate": 0.1},
+        ],
+        [
+            {"threshold": 10.0, "rate": 0.1},
+            {"threshold": 50.0, "rate": 0.2},
+            {"threshold": 100.0, "rate": 0.3},
+        ],
+    ],
+)
+def test_income_tax_bracket_order(
+    mock_economy_model, monkeypatch, personal_income_tax: list
+):
+    """
+    Tests that income tax is progressive regardless of the order of the brackets,
+    both when deducted by the agent and when calculated in a batch.
+
+    Args:
+        mock_economy_model: a mock model.
+        personal_income_tax (list): the income tax brackets.
+    """
+    monkeypatch.setitem(
+        mock_economy_model.policies, "personal_income_tax", personal_income_tax
+    )
+    # 40 taxed at 10%, 50 at 20%, and 900 at 30%
+    expected_tax = 4 + 10 + 270
+    person = PersonAgent(
+        mock_economy_model,
+        Demographic.MIDDLE_CLASS,
+        preferences={},
+        income=1000,
+    )
+    person.payday()
+    assert person.balance == approx(1000 - expected_tax)
+    assert batch_income_tax(np.array([1000.0]), personal_income_tax).tolist() == approx(
+        [expected_tax]
+    )
+
+
 @mark.parametrize(
     "income, expected_budget",
     [(1000, 1000), (-500, 0)],
@@ -2,6 +2,7 @@ import pytest
 from pytest import mark, approx
 import numpy as np
 import copy
+import logging
 from contextlib import nullcontext
 from engine.core.model import EconomyModel
 from engine.core.utils import num_prop
@@ -174,6 +175,95 @@ def test_get_employees(model: EconomyModel, industry_type: IndustryType):
     # TODO: redo this whenever starting unemployment logic changes
 
 
+def test_get_employees_after_employment_changes(model: EconomyModel):
+    """
+    Test that `get_employees` follows PersonAgents being hired, changing jobs, fired and removed.
+
+    Args:
+        model (EconomyModel): a freshly created model.
+    """
+    industries = {
+        industry.industry_type: industry
+        for industry in model.agents_by_type[IndustryAgent]
+    }
+    people = list(model.agents_by_type[PersonAgent])[:3]
+    for person in people:
+        person.employer = industries[IndustryType.GROCERIES]
+    assert set(model.get_employees(IndustryType.GROCERIES)) == set(people)
+
+    people[0].employer = industries[IndustryType.LUXURY]
+    people[1].employer = None
+    assert set(model.get_employees(IndustryType.GROCERIES)) == {people[2]}
+    assert set(model.get_employees(IndustryType.LUXURY)) == {people[0]}
+
+    people[0].remove()
+    assert len(model.get_employees(IndustryType.LUXURY)) == 0
+
+
+def test_get_market_after_consumer_changes(model: EconomyModel):
+    """
+    Test that the market's flattened preferences are rebuilt after PersonAgents are added,
+    removed, or have their preferences changed, and reused otherwise.
+
+    Args:
+        model (EconomyModel): a freshly created model.
+    """
+    layout = model.get_market().layout
+    assert model.get_market().layout is layout
+
+    person = PersonAgent(
+        model,
+        Demographic.MIDDLE_CLASS,
+        preferences={IndustryType.GROCERIES: 1.0},
+        income=100,
+    )
+    market = model.get_market()
+    assert market.layout is not layout
+    assert dict(market.get_demand(person)).keys() == {IndustryType.GROCERIES}
+
+    person.preferences = {IndustryType.HOUSING: 1.0}
+    market = model.get_market()
+    assert dict(market.get_demand(person)).keys() == {IndustryType.HOUSING}
+
+    layout = market.layout
+    person.remove()
+    layout_after_removal = model.get_market().layout
+    assert layout_after_removal is not layout
+    assert person.unique_id not in layout_after_removal.rows
+
+
+def test_policies_changed_during_step(model: EconomyModel):
+    """
+    Tests that replacing the policies changes the costs of the industries right away,
+    while changing them in place only takes effect next step.
+    """
+    industry = model.agents_by_type[IndustryAgent][0]
+    itype = industry.industry_type
+    variable_cost = industry.get_variable_cost()
+    fixed_cost = industry.get_fixed_cost_naive()
+
+    policies = copy.deepcopy(model.policies)
+    policies["tariffs"][itype] = (policies["tariffs"][itype] or 0) + 0.5
+    policies["property_tax"]["commercial"] = (
+        policies["property_tax"]["commercial"] or 0
+    ) + 0.5
+    model.policies = policies
+    tariffed_variable_cost = industry.get_variable_cost()
+    taxed_fixed_cost = industry.get_fixed_cost_naive()
+    assert tariffed_variable_cost == approx(
+        variable_cost + industry.raw_mat_cost * 0.5
+    )
+    assert taxed_fixed_cost == approx(fixed_cost + industry.fixed_cost * 0.5)
+
+    model.policies["tariffs"][itype] -= 0.5
+    model.policies["property_tax"]["commercial"] -= 0.5
+    assert industry.get_variable_cost() == tariffed_variable_cost
+    assert industry.get_fixed_cost_naive() == taxed_fixed_cost
+    model.steps += 1
+    assert industry.get_variable_cost() == approx(variable_cost)
+    assert industry.get_fixed_cost_naive() == approx(fixed_cost)
+
+
 @pytest.mark.parametrize(
     "inflation_rate, num_steps",
     [
@@ -235,6 +325,41 @@ def test_step(model: EconomyModel):
     assert model.get_week() == 52  # max for this model
 
 
+def test_step_logs_purchases_once(model: EconomyModel, caplog):
+    """
+    Tests that all purchases made during a step are logged together as a single record.
+    """
+    logging.disable(logging.NOTSET)
+    caplog.set_level(logging.INFO, logger="engine.agents.market")
+
+    model.step()
+
+    records = [
+        record
+        for record in caplog.records
+        if record.name == "engine.agents.market"
+        and "purchases made using saved funds" in record.getMessage()
+    ]
+    assert len(records) == 1
+    num_purchases = int(records[0].getMessage().split(" ", 1)[0])
+    # one line per purchase, after the header
+    assert len(records[0].getMessage().splitlines()) == num_purchases + 1
+
+
+def test_step_purchases_not_logged(model: EconomyModel, caplog):
+    """
+    Tests that purchases are neither kept nor formatted when INFO logging is disabled.
+    """
+    caplog.set_level(logging.WARNING, logger="engine.agents.market")
+
+    assert model.get_market().purchases is None
+    model.step()
+
+    assert not [
+        record for record in caplog.records if record.name == "engine.agents.market"
+    ]
+
+
 def test_reverse_step(model: EconomyModel):
     # TODO: test whenever reverse_step is implemented
     pass
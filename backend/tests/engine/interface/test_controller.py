@@ -10,6 +10,35 @@ from engine.types.indicators import Indicators
 from engine.interface.controller import ModelController
 
 
+def test_query_cache_with_generators(controller_model: dict):
+    """
+    Tests that one-shot iterables are filtered on correctly, both before and after
+    their query is cached.
+
+    Args:
+        controller_model(dict): the controller with the created model.
+    """
+    controller = controller_model["controller"]
+    model_id = controller_model["model_id"]
+    controller.step_model(model_id)
+
+    target_industries = [IndustryType.GROCERIES]
+    for _ in range(2):  # the second query is served from the cache
+        industries_df = controller.get_industry_data(
+            model_id, industries=(itype for itype in target_industries)
+        )
+        assert len(industries_df) == 2  # weeks 0 and 1
+        assert set(industries_df["industry"]) == set(target_industries)
+
+    target_metrics = [DemoMetrics.PROPORTION]
+    for _ in range(2):
+        metrics_df = controller.get_demo_metrics(
+            model_id, demo_metrics=(metric for metric in target_metrics)
+        )
+        assert set(metrics_df["week"]) == {0, 1}
+        assert DemoMetrics.PROPORTION in metrics_df.columns
+
+
 @mark.parametrize(
     "model_id,exception",
     [
@@ -388,6 +417,35 @@ def test_get_indicators(controller_model: dict):
     assert set(combined_filtered_df.columns) == {Indicators.GDP, "week"}
 
 
+def test_query_cache(controller_model: dict):
+    """
+    Test for the query cache used by `get_industry_data` and `get_demo_metrics`.
+    Tests that repeated queries are served from the cache and that stepping the model invalidates it.
+
+    Args:
+        controller_model(dict): the controller with the created model.
+    """
+    controller = controller_model["controller"]
+    model_id = controller_model["model_id"]
+    controller.step_model(model_id)
+
+    first_df = controller.get_industry_data(model_id)
+    assert model_id in controller.query_cache
+    # cached results are equal, but callers get their own copy
+    second_df = controller.get_industry_data(model_id)
+    assert second_df.equals(first_df)
+    assert second_df is not first_df
+
+    controller.get_demo_metrics(model_id)
+    assert len(controller.query_cache[model_id]) == 2
+
+    # stepping clears the cache so the new week shows up
+    controller.step_model(model_id)
+    assert model_id not in controller.query_cache
+    assert set(controller.get_industry_data(model_id)["week"]) == {0, 1, 2}
+    assert set(controller.get_demo_metrics(model_id)["week"]) == {0, 1, 2}
+
+
 @mark.parametrize(
     "model_id,exception",
     [